@@ -133,6 +133,10 @@ enum Commands {
         /// Show Inception Layer internal diagnostics
         #[arg(long)]
         inception: bool,
+
+        /// Print CAS blob count and total size as JSON (for scripts)
+        #[arg(long, conflicts_with_all = ["manifest", "session", "inception", "directory"])]
+        json: bool,
     },
 
     /// Mount the manifest as a FUSE filesystem
@@ -533,9 +537,14 @@ async fn async_main(
             session,
             directory,
             inception,
+            json,
         } => {
-            let dir = directory.unwrap_or_else(|| std::env::current_dir().unwrap());
-            cmd_status(&cas_root, manifest.as_deref(), session, inception, &dir)
+            if json {
+                cmd_status_json(&cas_root)
+            } else {
+                let dir = directory.unwrap_or_else(|| std::env::current_dir().unwrap());
+                cmd_status(&cas_root, manifest.as_deref(), session, inception, &dir)
+            }
         }
         Commands::Mount(args) => mount::run(args, &cas_root),
         Commands::Gc(args) => gc::run(&cas_root, args).await,
@@ -1184,6 +1193,24 @@ fn find_shim_library() -> Result<PathBuf> {
     );
 }
 
+/// Print CAS statistics as a single JSON object (machine-readable `status`)
+fn cmd_status_json(cas_root: &Path) -> Result<()> {
+    let stats = if cas_root.exists() {
+        CasStore::new(cas_root)?.stats()?
+    } else {
+        Default::default()
+    };
+    println!(
+        "{}",
+        serde_json::json!({
+            "cas_root": cas_root.display().to_string(),
+            "blob_count": stats.blob_count,
+            "total_bytes": stats.total_bytes,
+        })
+    );
+    Ok(())
+}
+
 /// Display CAS, manifest, and optionally session statistics
 fn cmd_status(
     cas_root: &Path,
@@ -11,6 +11,8 @@ Usage:
     python3 scripts/e2e_test.py --shared     # All datasets share CAS (default)
     python3 scripts/e2e_test.py --incremental # Use persistent CAS, test re-ingest
     python3 scripts/e2e_test.py --full       # Include large/xlarge datasets
+    python3 scripts/e2e_test.py --incremental --skip-unchanged
+                                             # Skip re-ingest of trees unchanged since their last ingest
 
 Requirements:
     - Python 3.10+
@@ -18,16 +20,24 @@ Requirements:
     - Built vrift binary (cargo build --release)
 """
 
+import ctypes
+import fcntl
+import hashlib
+import json
+import mmap
 import os
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
 import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 # ============================================================================
 # Configuration
@@ -41,39 +51,55 @@ BENCHMARKS_DIR = PROJECT_ROOT / "examples" / "benchmarks"
 # Persistent CAS for incremental mode
 PERSISTENT_CAS = Path.home() / ".vrift" / "e2e_test_cas"
 
+# Last verified vrift binary (path, mtime_ns, size) and its --version output
+BINARY_CHECK_FILE = PERSISTENT_CAS / ".binary_check.json"
+
+# Tree fingerprints of successfully ingested datasets (--skip-unchanged)
+FINGERPRINT_FILE = PERSISTENT_CAS / ".e2e_fingerprints.json"
+
+# Ingest manifests are LMDB environments; data.mdb starts with a meta page
+LMDB_DATA_FILE = "data.mdb"
+LMDB_MAGIC = 0xBEEFC0DE
+# Meta page: 16-byte page header, mm_magic at +16, mm_psize (FREE_DBI md_pad) at +40
+_LMDB_META = struct.Struct("<16xI20xI")
+
+# Per-file (size, mtime_ns) record fed into tree fingerprints
+_FINGERPRINT_ENTRY = struct.Struct("<QQ")
+
+# Concurrent npm installs when preparing datasets (bandwidth-bound, keep small)
+NPM_INSTALL_WORKERS = 2
+
+# Linux reflink ioctl (btrfs/xfs), same constant as vrift-cas reflink.rs
+FICLONE = 0x40049409
+
+# Bytes of stderr kept for failure messages when stdout is discarded
+STDERR_PREVIEW_BYTES = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetConfig:
+    package: str  # package.json fixture in BENCHMARKS_DIR
+    min_files: int  # Minimum node_modules files for a valid install
+    max_time_sec: int  # Ingest time budget (halved for re-ingest)
+
+
 # Test datasets (xsmall=extra-small lib, small=app, medium=standard, large=monorepo)
 DATASETS = {
-    "xsmall": {
-        "package": "xsmall_package.json",
-        "min_files": 10000,
-        "max_time_sec": 10,
-    },
-    "small": {
-        "package": "small_package.json",
-        "min_files": 20000,
-        "max_time_sec": 15,
-    },
-    "medium": {
-        "package": "medium_package.json",
-        "min_files": 50000,
-        "max_time_sec": 30,
-    },
-    "large": {
-        "package": "large_package.json",
-        "min_files": 200000,
-        "max_time_sec": 120,
-    },
+    "xsmall": DatasetConfig("xsmall_package.json", min_files=10000, max_time_sec=10),
+    "small": DatasetConfig("small_package.json", min_files=20000, max_time_sec=15),
+    "medium": DatasetConfig("medium_package.json", min_files=50000, max_time_sec=30),
+    "large": DatasetConfig("large_package.json", min_files=200000, max_time_sec=120),
 }
 
 # Monorepo config: packages with their dependencies (matches large_package.json)
 # Note: large_package.json is the monorepo, this maps package names to sub-dependencies
-MONOREPO_PACKAGES = {
-    "web": "medium_package.json",  # Heavy frontend
-    "mobile": "small_package.json",  # Mobile app
-    "shared": "xsmall_package.json",  # Shared utilities
-    "docs": "small_package.json",  # Documentation site
-    "storybook": "small_package.json",  # Storybook
-}
+MONOREPO_PACKAGES: tuple[tuple[str, str], ...] = (
+    ("web", "medium_package.json"),  # Heavy frontend
+    ("mobile", "small_package.json"),  # Mobile app
+    ("shared", "xsmall_package.json"),  # Shared utilities
+    ("docs", "small_package.json"),  # Documentation site
+    ("storybook", "small_package.json"),  # Storybook
+)
 
 
 class TestMode(Enum):
@@ -82,6 +108,10 @@ class TestMode(Enum):
     INCREMENTAL = "incremental"  # Persistent CAS, test re-ingest speed
 
 
+# node_modules file counts shared between ingest and dedup tests: path -> (mtime_ns, count)
+_FILE_COUNT_CACHE: dict[Path, tuple[int, int]] = {}
+
+
 @dataclass
 class TestResult:
     name: str
@@ -95,10 +125,29 @@ class TestResult:
 # Utilities
 # ============================================================================
 
+PASS = "✅ PASS"
+FAIL = "❌ FAIL"
+
 
-def run_cmd(cmd: list[str], cwd: Path | None = None, timeout: int = 600) -> tuple[int, str, str]:
-    """Run a command and return (exit_code, stdout, stderr)."""
+def run_cmd(
+    cmd: list[str], cwd: Path | None = None, timeout: int = 600, capture: Literal["both", "stderr"] = "both"
+) -> tuple[int, str, str]:
+    """Run a command and return (exit_code, stdout, stderr).
+
+    With capture="stderr", stdout is discarded and only the head of stderr is
+    decoded (callers only show a short slice of it on failure).
+    """
     try:
+        if capture == "stderr":
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+            )
+            return result.returncode, "", result.stderr[:STDERR_PREVIEW_BYTES].decode("utf-8", errors="replace")
+
         result = subprocess.run(
             cmd,
             cwd=cwd,
@@ -111,28 +160,225 @@ def run_cmd(cmd: list[str], cwd: Path | None = None, timeout: int = 600) -> tupl
         return -1, "", "Timeout"
 
 
+def _scandir_recursive(directory: Path | str) -> Iterator[os.DirEntry[str]]:
+    """Yield every entry below directory without following symlinks.
+
+    Entries are streamed in on-disk order straight from the scandir iterator:
+    nothing is sorted or collected per directory, so huge flat directories
+    (node_modules/.pnpm) cost no extra memory. Callers must not rely on order.
+    Unreadable or vanished directories (e.g. code-signed bundles) are skipped.
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    yield entry
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except (PermissionError, FileNotFoundError):
+            continue
+
+
 def count_files(directory: Path) -> int:
     """Count files in directory recursively."""
-    count = 0
-    for _, _, files in os.walk(directory):
-        count += len(files)
+    return sum(1 for entry in _scandir_recursive(directory) if entry.is_file(follow_symlinks=False))
+
+
+def _find_first(directory: Path, name: str) -> Path | None:
+    """Return the first entry called name below directory, stopping the walk there."""
+    for entry in _scandir_recursive(directory):
+        if entry.name == name:
+            return Path(entry.path)
+    return None
+
+
+def cached_count_files(directory: Path) -> int:
+    """count_files() memoized per tree, invalidated when the directory mtime changes."""
+    key = directory.resolve()
+    try:
+        mtime_ns = key.stat().st_mtime_ns
+    except OSError:
+        # Missing tree (e.g. failed install): count_files() reports 0, nothing to cache
+        return count_files(directory)
+    cached = _FILE_COUNT_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    count = count_files(directory)
+    _FILE_COUNT_CACHE[key] = (mtime_ns, count)
     return count
 
 
-def get_dir_size_mb(directory: Path) -> float:
-    """Get directory size in MB."""
-    total = 0
-    for entry in directory.rglob("*"):
-        if entry.is_file():
-            total += entry.stat().st_size
-    return total / (1024 * 1024)
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy a fixture file, cloning it (reflink) when the filesystem supports it.
+
+    Hard links are deliberately not used: npm may rewrite package.json in
+    place, which would write through the link into the source fixture.
+    """
+    try:
+        dst.unlink(missing_ok=True)
+        if sys.platform == "darwin":
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return
+        elif sys.platform.startswith("linux"):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+    except (OSError, AttributeError):
+        pass  # No reflink support (EXDEV, EOPNOTSUPP, ...): plain copy below
+    shutil.copy(src, dst)
+
+
+def cas_stats(cas_dir: Path) -> tuple[int, int]:
+    """Return (blob_count, total_bytes) for a CAS.
+
+    Asks `vrift status --json` first; binaries without it fall back to walking the CAS.
+    """
+    code, stdout, _ = run_cmd([str(VRIFT_BINARY), "--the-source-root", str(cas_dir), "status", "--json"], timeout=120)
+    if code == 0:
+        try:
+            stats = json.loads(stdout)
+            return int(stats["blob_count"]), int(stats["total_bytes"])
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    blobs = total = 0
+    for entry in _scandir_recursive(cas_dir):
+        if entry.is_file(follow_symlinks=False):
+            blobs += 1
+            total += entry.stat(follow_symlinks=False).st_size
+    return blobs, total
+
+
+def manifest_is_valid(manifest_path: Path) -> bool:
+    """Check that an ingest manifest (LMDB environment) has an intact meta page.
+
+    Maps data.mdb and inspects only the first meta page header, which catches
+    missing, empty and truncated manifests without reading the whole file.
+    """
+    data_file = manifest_path / LMDB_DATA_FILE if manifest_path.is_dir() else manifest_path
+    try:
+        with open(data_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < _LMDB_META.size:
+                return False
+            magic, psize = _LMDB_META.unpack_from(mm)
+            # Both meta pages (0 and 1) must be present
+            return magic == LMDB_MAGIC and psize > 0 and len(mm) >= 2 * psize
+    except (OSError, ValueError):
+        # ValueError: mmap of an empty file
+        return False
+
+
+def _tree_fingerprint(directory: Path) -> tuple[str, int]:
+    """Return (fingerprint, file_count) for a tree from its (relpath, size, mtime_ns) listing."""
+    prefix_len = len(os.fspath(directory)) + 1
+    listing = []
+    for entry in _scandir_recursive(directory):
+        if entry.is_file(follow_symlinks=False):
+            st = entry.stat(follow_symlinks=False)
+            listing.append((entry.path[prefix_len:], st.st_size, st.st_mtime_ns))
+
+    # Walk order is arbitrary; sort only the final listing
+    listing.sort()
+    digest = hashlib.blake2b(digest_size=32)
+    for relpath, size, mtime_ns in listing:
+        digest.update(os.fsencode(relpath) + b"\0")
+        digest.update(_FINGERPRINT_ENTRY.pack(size, mtime_ns))
+    return digest.hexdigest(), len(listing)
+
+
+def _load_fingerprints() -> dict[str, str]:
+    try:
+        with open(FINGERPRINT_FILE) as f:
+            return dict(json.load(f))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_fingerprint(key: str, fingerprint: str) -> None:
+    fingerprints = _load_fingerprints()
+    fingerprints[key] = fingerprint
+    try:
+        FINGERPRINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = FINGERPRINT_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(fingerprints, indent=2))
+        tmp_path.replace(FINGERPRINT_FILE)
+    except OSError:
+        pass  # Cache is best-effort
+
+
+def _reset_perms(path: str) -> None:
+    try:
+        os.chflags(path, 0)  # type: ignore[attr-defined]
+    except AttributeError:
+        pass  # No file flags on this platform (Linux)
+    os.chmod(path, 0o700)
+
+
+def _rmtree_onerror(func: Any, path: str, exc_info: Any) -> None:
+    """shutil.rmtree error handler mirroring tempfile's cleanup.
+
+    Tier-2 ingest marks CAS blobs immutable (UF_IMMUTABLE on macOS), and the
+    hard-linked node_modules files share the flag: clear flags and read-only
+    permissions on the entry and its parent, then retry.
+    """
+    if issubclass(exc_info[0], FileNotFoundError):
+        return
+    if not issubclass(exc_info[0], PermissionError):
+        raise exc_info[1]
+    try:
+        _reset_perms(os.path.dirname(path))
+        _reset_perms(path)
+        if not os.path.isdir(path) or os.path.islink(path):
+            os.unlink(path)
+        elif func is os.rmdir:
+            os.rmdir(path)
+        else:
+            shutil.rmtree(path, onerror=_rmtree_onerror)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_entry(path: str) -> None:
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, onerror=_rmtree_onerror)
+    else:
+        try:
+            os.unlink(path)
+        except PermissionError:
+            _rmtree_onerror(os.unlink, path, sys.exc_info())
+
+
+def _fast_rmtree(root: str) -> None:
+    """Remove a large tree (node_modules + CAS) quickly.
+
+    Linux uses `rm -rf` (unlinkat loop in C); anything left over, or other
+    platforms, is removed with one rmtree per top-level child in parallel,
+    clearing immutable flags and read-only permissions as needed.
+    """
+    if sys.platform.startswith("linux"):
+        # Errors are not fatal here: leftovers are handled by the fallback below
+        subprocess.run(["rm", "-rf", root], stderr=subprocess.DEVNULL, check=False)
+        if not os.path.lexists(root):
+            return
+
+    with os.scandir(root) as it:
+        children = [entry.path for entry in it]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # list() re-raises the first failure (e.g. PermissionError)
+        list(executor.map(_remove_entry, children))
+    os.rmdir(root)
 
 
 def print_result(result: TestResult) -> None:
-    """Print test result with color."""
-    status = "✅ PASS" if result.passed else "❌ FAIL"
-    print(f"  {status} {result.name}")
-    print(f"       Files: {result.files:,} | Time: {result.duration_sec:.2f}s | {result.message}")
+    """Print test result with color (one write per result)."""
+    status = PASS if result.passed else FAIL
+    sys.stdout.write(
+        f"  {status} {result.name}\n"
+        f"       Files: {result.files:,} | Time: {result.duration_sec:.2f}s | {result.message}\n"
+    )
 
 
 # ============================================================================
@@ -150,6 +396,7 @@ def test_binary_build() -> TestResult:
             ["cargo", "build", "--release", "-p", "vrift-cli"],
             cwd=PROJECT_ROOT,
             timeout=300,
+            capture="stderr",
         )
         if code != 0:
             return TestResult(
@@ -160,9 +407,32 @@ def test_binary_build() -> TestResult:
                 message=f"Build failed: {stderr[:100]}",
             )
 
+    # Skip `vrift --version` if this exact binary was already verified
+    st = VRIFT_BINARY.stat()
+    key = [str(VRIFT_BINARY), st.st_mtime_ns, st.st_size]
+    try:
+        cache = json.loads(BINARY_CHECK_FILE.read_text())
+        if cache["key"] == key:
+            return TestResult(
+                name="Binary Build",
+                passed=True,
+                duration_sec=time.time() - start,
+                files=0,
+                message=str(cache["version"]),
+            )
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
     # Verify binary works
     code, stdout, _ = run_cmd([str(VRIFT_BINARY), "--version"])
 
+    if code == 0:
+        try:
+            BINARY_CHECK_FILE.parent.mkdir(parents=True, exist_ok=True)
+            BINARY_CHECK_FILE.write_text(json.dumps({"key": key, "version": stdout.strip()}))
+        except OSError:
+            pass  # Cache is best-effort
+
     return TestResult(
         name="Binary Build",
         passed=code == 0,
@@ -172,16 +442,16 @@ def test_binary_build() -> TestResult:
     )
 
 
-def test_dataset_ingest(
-    name: str, config: dict[str, Any], work_dir: Path, cas_dir: Path, is_reingest: bool = False
-) -> TestResult:
-    """Test: Ingest a dataset and verify."""
+def npm_install_dataset(
+    name: str, config: DatasetConfig, work_dir: Path, is_reingest: bool = False
+) -> tuple[float, TestResult | None]:
+    """Install a dataset's node_modules; return (install_time, failure or None)."""
     start = time.time()
     test_name = f"Re-ingest {name}" if is_reingest else f"Ingest {name}"
 
-    package_json = BENCHMARKS_DIR / config["package"]
+    package_json = BENCHMARKS_DIR / config.package
     if not package_json.exists():
-        return TestResult(
+        return 0.0, TestResult(
             name=test_name,
             passed=False,
             duration_sec=0,
@@ -194,61 +464,110 @@ def test_dataset_ingest(
     dataset_dir.mkdir(parents=True, exist_ok=True)
 
     node_modules = dataset_dir / "node_modules"
-    install_time = 0.0
 
     # Skip npm install for re-ingest if node_modules exists
-    if not node_modules.exists() or not is_reingest:
-        shutil.copy(package_json, dataset_dir / "package.json")
+    if node_modules.exists() and is_reingest:
+        return 0.0, None
+
+    _fast_copy(package_json, dataset_dir / "package.json")
 
-        # Install dependencies
-        install_start = time.time()
+    # Install dependencies
+    code, _, stderr = run_cmd(
+        ["npm", "install", "--legacy-peer-deps", "--silent"],
+        cwd=dataset_dir,
+        timeout=300,
+        capture="stderr",
+    )
+    if code != 0:
+        # Try without legacy-peer-deps
         code, _, stderr = run_cmd(
-            ["npm", "install", "--legacy-peer-deps", "--silent"],
+            ["npm", "install", "--silent"],
             cwd=dataset_dir,
             timeout=300,
+            capture="stderr",
         )
-        if code != 0:
-            # Try without legacy-peer-deps
-            code, _, stderr = run_cmd(
-                ["npm", "install", "--silent"],
-                cwd=dataset_dir,
-                timeout=300,
-            )
 
-        if code != 0:
-            return TestResult(
-                name=test_name,
-                passed=False,
-                duration_sec=time.time() - start,
-                files=0,
-                message=f"npm install failed: {stderr[:100]}",
-            )
+    if code != 0:
+        return 0.0, TestResult(
+            name=test_name,
+            passed=False,
+            duration_sec=time.time() - start,
+            files=0,
+            message=f"npm install failed: {stderr[:100]}",
+        )
 
-        install_time = time.time() - install_start
+    _FILE_COUNT_CACHE.pop(node_modules.resolve(), None)
+    return time.time() - start, None
 
-    # Count files
-    file_count = count_files(node_modules)
 
-    if file_count < config["min_files"]:
+def vrift_ingest_dataset(
+    name: str,
+    config: DatasetConfig,
+    work_dir: Path,
+    cas_dir: Path,
+    is_reingest: bool = False,
+    install_time: float = 0.0,
+    skip_unchanged: bool = False,
+) -> TestResult:
+    """Ingest an installed dataset and verify the manifest and timing.
+
+    With skip_unchanged, a re-ingest of a tree whose fingerprint matches its
+    last successful ingest into the same CAS is reported without running vrift.
+    """
+    start = time.time()
+    test_name = f"Re-ingest {name}" if is_reingest else f"Ingest {name}"
+    node_modules = work_dir / name / "node_modules"
+
+    # Clear any previous vrift metadata (before counting, so the cached count stays valid)
+    vrift_meta = node_modules / ".vrift"
+    if vrift_meta.exists():
+        shutil.rmtree(vrift_meta)
+
+    # Count files (reused by the dedup test and re-ingest pass)
+    fingerprint = ""
+    if skip_unchanged:
+        # The fingerprint walk also counts files: seed the count cache from it
+        try:
+            mtime_ns = node_modules.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        fingerprint, file_count = _tree_fingerprint(node_modules)
+        if mtime_ns is not None:
+            _FILE_COUNT_CACHE[node_modules.resolve()] = (mtime_ns, file_count)
+    else:
+        file_count = cached_count_files(node_modules)
+
+    if file_count < config.min_files:
         return TestResult(
             name=test_name,
             passed=False,
             duration_sec=time.time() - start,
             files=file_count,
-            message=f"Too few files: {file_count} < {config['min_files']}",
+            message=f"Too few files: {file_count} < {config.min_files}",
         )
 
-    # Clear any previous vrift metadata
-    vrift_meta = node_modules / ".vrift"
-    if vrift_meta.exists():
-        shutil.rmtree(vrift_meta)
+    manifest_path = work_dir / f"{name}_manifest.bin"
+    fingerprint_key = f"{cas_dir.resolve()}::{name}"
+    if (
+        is_reingest
+        and fingerprint
+        and _load_fingerprints().get(fingerprint_key) == fingerprint
+        and manifest_is_valid(manifest_path)
+    ):
+        return TestResult(
+            name=test_name,
+            passed=True,
+            duration_sec=time.time() - start,
+            files=file_count,
+            message="cached (no-op reingest)",
+        )
 
     # Run ingest with new --the-source-root flag
-    manifest_path = work_dir / f"{name}_manifest.bin"
     ingest_start = time.time()
-    code, stdout, stderr = run_cmd(
+    code, _, stderr = run_cmd(
         [str(VRIFT_BINARY), "--the-source-root", str(cas_dir), "ingest", str(node_modules), "-o", str(manifest_path)],
-        timeout=config["max_time_sec"] * 2,
+        timeout=config.max_time_sec * 2,
+        capture="stderr",
     )
     ingest_time = time.time() - ingest_start
 
@@ -261,18 +580,21 @@ def test_dataset_ingest(
             message=f"Ingest failed: {stderr[:200]}",
         )
 
-    # Verify manifest created
-    if not manifest_path.exists():
+    # Verify manifest created and not truncated
+    if not manifest_is_valid(manifest_path):
         return TestResult(
             name=test_name,
             passed=False,
             duration_sec=time.time() - start,
             files=file_count,
-            message="Manifest not created",
+            message="Manifest missing or corrupt",
         )
 
+    if fingerprint:
+        _save_fingerprint(fingerprint_key, fingerprint)
+
     # Check timing (re-ingest should be faster)
-    max_time = config["max_time_sec"] / 2 if is_reingest else config["max_time_sec"]
+    max_time = config.max_time_sec / 2 if is_reingest else config.max_time_sec
     passed = ingest_time <= max_time
     rate = int(file_count / ingest_time) if ingest_time > 0 else 0
 
@@ -291,20 +613,81 @@ def test_dataset_ingest(
     )
 
 
-def test_dedup_efficiency(work_dir: Path, cas_dir: Path, mode: TestMode) -> TestResult:
-    """Test: Cross-project deduplication."""
-    start = time.time()
+def test_dataset_ingest(
+    name: str,
+    config: DatasetConfig,
+    work_dir: Path,
+    cas_dir: Path,
+    is_reingest: bool = False,
+    skip_unchanged: bool = False,
+) -> TestResult:
+    """Test: Ingest a dataset and verify."""
+    install_time, failure = npm_install_dataset(name, config, work_dir, is_reingest)
+    if failure is not None:
+        return failure
+    return vrift_ingest_dataset(name, config, work_dir, cas_dir, is_reingest, install_time, skip_unchanged)
+
+
+def _run_isolated_ingest(
+    args: tuple[str, DatasetConfig, Path, Path],
+) -> tuple[TestResult, dict[Path, tuple[int, int]]]:
+    """ProcessPoolExecutor entry point: ingest one dataset into its own CAS.
+
+    Also returns the worker's file count cache so the parent can reuse the counts.
+    """
+    return test_dataset_ingest(*args), _FILE_COUNT_CACHE
 
-    # Check CAS stats
-    cas_blobs = count_files(cas_dir)
-    cas_size_mb = get_dir_size_mb(cas_dir)
 
-    # Count total files in all datasets
-    total_files = 0
-    for name in DATASETS:
-        node_modules = work_dir / name / "node_modules"
-        if node_modules.exists():
-            total_files += count_files(node_modules)
+def ingest_datasets(
+    names: list[str], work_dir: Path, cas_dir: Path, skip_unchanged: bool = False
+) -> Iterator[tuple[str, TestResult]]:
+    """Install datasets concurrently and ingest each as soon as its install finishes.
+
+    Installs share a small pool (npm is network-bound); ingests run one at a
+    time on their own worker so their timings stay comparable. Yields
+    (name, result) in completion order.
+    """
+    with (
+        ThreadPoolExecutor(max_workers=NPM_INSTALL_WORKERS) as install_pool,
+        ThreadPoolExecutor(max_workers=1) as ingest_pool,
+    ):
+        installs = {install_pool.submit(npm_install_dataset, name, DATASETS[name], work_dir): name for name in names}
+        ingests: dict[Future[TestResult], str] = {}
+        pending: set[Future[Any]] = set(installs)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in ingests:
+                    yield ingests[future], future.result()
+                    continue
+
+                name = installs[future]
+                install_time, failure = future.result()
+                if failure is not None:
+                    yield name, failure
+                    continue
+                ingest = ingest_pool.submit(
+                    vrift_ingest_dataset, name, DATASETS[name], work_dir, cas_dir, False, install_time, skip_unchanged
+                )
+                ingests[ingest] = name
+                pending.add(ingest)
+
+
+def test_dedup_efficiency(
+    work_dir: Path, cas_dir: Path, mode: TestMode, dataset_names: list[str] | None = None
+) -> TestResult:
+    """Test: Cross-project deduplication (over dataset_names, default: all datasets)."""
+    start = time.time()
+
+    dataset_dirs = [work_dir / name / "node_modules" for name in (dataset_names or DATASETS)]
+    dataset_dirs = [d for d in dataset_dirs if d.exists()]
+    # Dataset counts come from the ingest tests' cache; CAS stats come from vrift.
+    # Both run concurrently (scandir/stat and the subprocess wait release the GIL).
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        stats_future = executor.submit(cas_stats, cas_dir)
+        total_files = sum(executor.map(cached_count_files, dataset_dirs))
+        cas_blobs, cas_bytes = stats_future.result()
+    cas_size_mb = cas_bytes / (1024 * 1024)
 
     if total_files == 0:
         return TestResult(
@@ -349,19 +732,18 @@ def test_eperm_handling(work_dir: Path, cas_dir: Path) -> TestResult:
             message="Skipped (xlarge not tested)",
         )
 
-    # Look for Chromium.app
-    chromium_paths = list(xlarge_dir.rglob("Chromium.app"))
-    has_chromium = len(chromium_paths) > 0
+    # Look for Chromium.app (first match is enough)
+    has_chromium = _find_first(xlarge_dir, "Chromium.app") is not None
 
     # Check if ingest succeeded (xlarge result would show success)
     manifest = work_dir / "xlarge_manifest.bin"
-    ingest_succeeded = manifest.exists()
+    ingest_succeeded = manifest_is_valid(manifest)
 
     return TestResult(
         name="EPERM Handling",
         passed=ingest_succeeded,
         duration_sec=time.time() - start,
-        files=len(chromium_paths),
+        files=int(has_chromium),
         message=f"Chromium.app found: {has_chromium}, Ingest: {'✓' if ingest_succeeded else '✗'}",
     )
 
@@ -388,6 +770,27 @@ def test_link_strategy() -> TestResult:
     )
 
 
+def _install_monorepo_package(monorepo_dir: Path, pkg_name: str, pkg_json: str) -> tuple[str, int, float, str]:
+    """Install one monorepo package; return (name, file_count, install_time, error)."""
+    pkg_dir = monorepo_dir / "packages" / pkg_name
+    pkg_dir.mkdir(parents=True, exist_ok=True)
+    _fast_copy(BENCHMARKS_DIR / pkg_json, pkg_dir / "package.json")
+
+    install_start = time.time()
+    code, _, stderr = run_cmd(
+        ["npm", "install", "--legacy-peer-deps", "--silent"],
+        cwd=pkg_dir,
+        timeout=300,
+        capture="stderr",
+    )
+    install_time = time.time() - install_start
+
+    if code != 0:
+        return pkg_name, 0, install_time, stderr or f"exit code {code}"
+
+    return pkg_name, count_files(pkg_dir / "node_modules"), install_time, ""
+
+
 def test_monorepo_dedup(work_dir: Path, cas_dir: Path) -> TestResult:
     """Test: True monorepo cross-package deduplication.
 
@@ -399,49 +802,40 @@ def test_monorepo_dedup(work_dir: Path, cas_dir: Path) -> TestResult:
     monorepo_dir = work_dir / "monorepo"
     monorepo_dir.mkdir(parents=True, exist_ok=True)
 
-    total_files = 0
-    package_stats = {}
-
-    # Create each package with its own node_modules
+    # Install all packages concurrently; each has its own node_modules (NO hoisting)
     pkg_count = len(MONOREPO_PACKAGES)
-    for idx, (pkg_name, pkg_json) in enumerate(MONOREPO_PACKAGES.items(), 1):
-        pkg_dir = monorepo_dir / "packages" / pkg_name
-        pkg_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy package.json
-        src_pkg = BENCHMARKS_DIR / pkg_json
-        if not src_pkg.exists():
-            continue
-
-        # Show progress
-        print(f"       📦 [{idx}/{pkg_count}] Installing {pkg_name} ({pkg_json})...", flush=True)
-
-        shutil.copy(src_pkg, pkg_dir / "package.json")
-
-        # Install dependencies independently (NO hoisting)
-        install_start = time.time()
-        code, _, stderr = run_cmd(
-            ["npm", "install", "--legacy-peer-deps", "--silent"],
-            cwd=pkg_dir,
-            timeout=300,
+    file_counts: dict[str, int] = {}
+    failure = ""
+    with ThreadPoolExecutor(max_workers=min(pkg_count, os.cpu_count() or 1)) as executor:
+        futures = []
+        for idx, (pkg_name, pkg_json) in enumerate(MONOREPO_PACKAGES, 1):
+            if not (BENCHMARKS_DIR / pkg_json).exists():
+                continue
+            print(f"       📦 [{idx}/{pkg_count}] Installing {pkg_name} ({pkg_json})...", flush=True)
+            futures.append(executor.submit(_install_monorepo_package, monorepo_dir, pkg_name, pkg_json))
+
+        for future in as_completed(futures):
+            pkg_name, file_count, install_time, error = future.result()
+            if error:
+                failure = failure or f"npm install failed for {pkg_name}: {error[:100]}"
+                for pending in futures:
+                    pending.cancel()
+                continue
+            file_counts[pkg_name] = file_count
+            print(f"       ✓ {pkg_name}: {file_count:,} files ({install_time:.1f}s)", flush=True)
+
+    if failure:
+        return TestResult(
+            name="Monorepo Dedup",
+            passed=False,
+            duration_sec=time.time() - start,
+            files=0,
+            message=failure,
         )
-        install_time = time.time() - install_start
-
-        if code != 0:
-            return TestResult(
-                name="Monorepo Dedup",
-                passed=False,
-                duration_sec=time.time() - start,
-                files=0,
-                message=f"npm install failed for {pkg_name}: {stderr[:100]}",
-            )
 
-        # Count files
-        node_modules = pkg_dir / "node_modules"
-        file_count = count_files(node_modules)
-        total_files += file_count
-        package_stats[pkg_name] = file_count
-        print(f"       ✓ {pkg_name}: {file_count:,} files ({install_time:.1f}s)", flush=True)
+    # Keep the summary in declaration order regardless of completion order
+    package_stats = {name: file_counts[name] for name, _ in MONOREPO_PACKAGES if name in file_counts}
+    total_files = sum(package_stats.values())
 
     if total_files == 0:
         return TestResult(
@@ -457,9 +851,10 @@ def test_monorepo_dedup(work_dir: Path, cas_dir: Path) -> TestResult:
     manifest_path = work_dir / "monorepo_manifest.bin"
 
     ingest_start = time.time()
-    code, stdout, stderr = run_cmd(
+    code, _, stderr = run_cmd(
         [str(VRIFT_BINARY), "--the-source-root", str(cas_dir), "ingest", str(packages_dir), "-o", str(manifest_path)],
         timeout=120,
+        capture="stderr",
     )
     ingest_time = time.time() - ingest_start
 
@@ -473,7 +868,7 @@ def test_monorepo_dedup(work_dir: Path, cas_dir: Path) -> TestResult:
         )
 
     # Check CAS blob count
-    cas_blobs = count_files(cas_dir)
+    cas_blobs, _ = cas_stats(cas_dir)
     dedup_ratio = 1 - (cas_blobs / total_files) if total_files > 0 else 0
 
     # Expect significant dedup (packages share many common deps)
@@ -500,6 +895,7 @@ def main() -> None:
     mode = TestMode.SHARED  # Default
     full_test = False
     monorepo_test = False
+    skip_unchanged = False
 
     for arg in sys.argv[1:]:
         if arg == "--isolated":
@@ -512,6 +908,8 @@ def main() -> None:
             full_test = True
         elif arg == "--monorepo":
             monorepo_test = True
+        elif arg == "--skip-unchanged":
+            skip_unchanged = True
 
     print("=" * 60)
     print("VRift E2E Regression Test Suite")
@@ -545,9 +943,8 @@ def main() -> None:
         datasets_to_test = ["small", "medium", "large", "xlarge"]
 
     # Create temp directory
-    tmp_dir_obj = tempfile.TemporaryDirectory(prefix="vrift-e2e-")
+    tmp = tempfile.mkdtemp(prefix="vrift-e2e-")
     try:
-        tmp = tmp_dir_obj.name
         work_dir = Path(tmp) / "work"
         work_dir.mkdir()
 
@@ -564,28 +961,34 @@ def main() -> None:
             print(f"📁 CAS dir: {cas_shared} (temporary)")
 
         if mode == TestMode.ISOLATED:
-            # Each dataset gets its own CAS
+            # Each dataset gets its own CAS, so the ingests are independent: run them in parallel
+            ingest_args = []
             for name in datasets_to_test:
-                print(f"\n📊 Test: Ingest {name.upper()} (Isolated CAS)")
                 cas_isolated = Path(tmp) / f"cas_{name}"
                 cas_isolated.mkdir()
-                config = DATASETS[name]
-                result = test_dataset_ingest(name, config, work_dir, cas_isolated)
+                ingest_args.append((name, DATASETS[name], work_dir, cas_isolated))
+
+            with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+                ingest_results = []
+                for result, file_counts in executor.map(_run_isolated_ingest, ingest_args):
+                    ingest_results.append(result)
+                    _FILE_COUNT_CACHE.update(file_counts)
+
+            for (name, _, _, cas_isolated), result in zip(ingest_args, ingest_results, strict=True):
+                print(f"\n📊 Test: Ingest {name.upper()} (Isolated CAS)")
                 print_result(result)
                 results.append(result)
 
                 # Individual dedup check
                 print(f"\n🔗 Test: Dedup {name}")
-                result = test_dedup_efficiency(work_dir, cas_isolated, mode)
+                result = test_dedup_efficiency(work_dir, cas_isolated, mode, [name])
                 print_result(result)
                 results.append(result)
 
         elif mode == TestMode.SHARED:
             # All datasets share CAS
-            for name in datasets_to_test:
+            for name, result in ingest_datasets(datasets_to_test, work_dir, cas_shared):
                 print(f"\n📊 Test: Ingest {name.upper()} (Shared CAS)")
-                config = DATASETS[name]
-                result = test_dataset_ingest(name, config, work_dir, cas_shared)
                 print_result(result)
                 results.append(result)
 
@@ -597,10 +1000,8 @@ def main() -> None:
 
         elif mode == TestMode.INCREMENTAL:
             # First pass: ingest
-            for name in datasets_to_test:
+            for name, result in ingest_datasets(datasets_to_test, work_dir, cas_shared, skip_unchanged):
                 print(f"\n📊 Test: Initial Ingest {name.upper()}")
-                config = DATASETS[name]
-                result = test_dataset_ingest(name, config, work_dir, cas_shared, is_reingest=False)
                 print_result(result)
                 results.append(result)
 
@@ -612,7 +1013,9 @@ def main() -> None:
             for name in datasets_to_test:
                 print(f"\n📊 Test: Re-ingest {name.upper()}")
                 config = DATASETS[name]
-                result = test_dataset_ingest(name, config, work_dir, cas_shared, is_reingest=True)
+                result = test_dataset_ingest(
+                    name, config, work_dir, cas_shared, is_reingest=True, skip_unchanged=skip_unchanged
+                )
                 print_result(result)
                 results.append(result)
 
@@ -641,7 +1044,7 @@ def main() -> None:
             results.append(result)
     finally:
         try:
-            tmp_dir_obj.cleanup()
+            _fast_rmtree(tmp)
         except PermissionError:
             print("\n⚠️  Cleanup warning: some temporary files could not be removed (Permission Denied).")
             print("   These will be cleaned up by the system or next CI run.")
@@ -1,32 +1,233 @@
 #!/usr/bin/env python3
+import ctypes
+import fnmatch
 import glob
+import mmap
+import os
+import select
+import struct
 import sys
 import time
+from typing import BinaryIO
+
+LOG_DIR = "/tmp"
+LOG_NAME_PATTERN = "vrift-shim-*.log"
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class LogFollower:
+    """Follows shim logs and streams newly appended bytes to stdout."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, BinaryIO] = {}
+        self.offsets: dict[str, int] = {}
+        self.unreadable: set[str] = set()
+        self.current: str | None = None
+
+    def follow(self, path: str) -> bool:
+        """Start following path and print what it holds so far.
+
+        A path that is already followed is only drained, unless it now names a
+        new file (log recreated), which is then followed from the start.
+        """
+        f = self.files.get(path)
+        if f is not None:
+            try:
+                if os.stat(path).st_ino == os.fstat(f.fileno()).st_ino:
+                    self.drain(path)
+                    return True
+            except OSError:
+                pass
+            self.forget(path)
+
+        try:
+            f = open(path, "rb")
+        except OSError as e:
+            if path not in self.unreadable:
+                print(f"Error reading {path}: {e}")
+                self.unreadable.add(path)
+            return False
+        self.unreadable.discard(path)
+        self.files[path] = f
+        self.offsets[path] = 0
+        self.drain(path)
+        return True
+
+    def follow_new(self) -> list[str]:
+        """Follow logs in LOG_DIR that are not followed yet; return their paths."""
+        followed = []
+        for path in glob.glob(os.path.join(LOG_DIR, LOG_NAME_PATTERN)):
+            if path not in self.files and path not in self.unreadable and self.follow(path):
+                followed.append(path)
+        return followed
+
+    def forget(self, path: str) -> None:
+        f = self.files.pop(path, None)
+        if f is not None:
+            f.close()
+        self.offsets.pop(path, None)
+
+    def drain(self, path: str) -> None:
+        """Write bytes appended to path since the last drain."""
+        f = self.files.get(path)
+        if f is None:
+            return
+        size = os.fstat(f.fileno()).st_size
+        offset = self.offsets[path]
+        if size < offset:
+            offset = 0  # Truncated: start over
+        if size == offset:
+            return
+
+        if path != self.current:
+            pid = path.split("-")[-1].split(".")[0]
+            print(f"\n\033[1;32m--- Log for PID {pid} ({path}) ---\033[0m")
+            # Header went through the text layer; flush it before writing raw bytes
+            sys.stdout.flush()
+            self.current = path
+
+        out = sys.stdout.buffer
+        # Map the log and hand the new pages straight to stdout (no str copy/decode)
+        with (
+            mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+            view[offset:size] as chunk,
+        ):
+            out.write(chunk)
+        out.flush()
+        self.offsets[path] = size
+
+    def drain_all(self) -> None:
+        for path in list(self.files):
+            self.drain(path)
+
+
+def watch_inotify(follower: LogFollower) -> None:
+    """Linux: inotify on LOG_DIR for new logs plus an IN_MODIFY watch per followed log."""
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def watch_file(path: str) -> None:
+        wd = libc.inotify_add_watch(fd, os.fsencode(path), IN_MODIFY)
+        if wd >= 0:
+            file_wds[wd] = path
+        # Catch up on anything written before the watch existed
+        follower.drain(path)
+
+    file_wds: dict[int, str] = {}
+    try:
+        dir_wd = libc.inotify_add_watch(fd, os.fsencode(LOG_DIR), IN_CREATE | IN_MOVED_TO | IN_DELETE | IN_MOVED_FROM)
+        if dir_wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {LOG_DIR}")
+
+        # Pick up logs that existed before the watch was installed
+        for path in follower.follow_new():
+            watch_file(path)
+
+        while True:
+            buf = os.read(fd, 64 * 1024)
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, name_len = _INOTIFY_EVENT.unpack_from(buf, offset)
+                offset += _INOTIFY_EVENT.size
+                name = os.fsdecode(buf[offset : offset + name_len].rstrip(b"\0"))
+                offset += name_len
+
+                if wd != dir_wd:
+                    if mask & IN_MODIFY and wd in file_wds:
+                        follower.drain(file_wds[wd])
+                    continue
+
+                if not fnmatch.fnmatchcase(name, LOG_NAME_PATTERN):
+                    continue
+                path = os.path.join(LOG_DIR, name)
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    if follower.follow(path):
+                        watch_file(path)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    follower.forget(path)
+    finally:
+        os.close(fd)
+
+
+def watch_kqueue(follower: LogFollower) -> None:
+    """macOS/BSD: kqueue on LOG_DIR for new logs plus NOTE_WRITE|NOTE_EXTEND per followed log."""
+    dir_fd = os.open(LOG_DIR, os.O_RDONLY)
+    kq = select.kqueue()
+    followed_fds: dict[int, str] = {}
+
+    def watch_new_logs() -> None:
+        for path in follower.follow_new():
+            fileno = follower.files[path].fileno()
+            event = select.kevent(
+                fileno,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME,
+            )
+            kq.control([event], 0)
+            followed_fds[fileno] = path
+            # Catch up on anything written before the watch existed
+            follower.drain(path)
+
+    try:
+        event = select.kevent(
+            dir_fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_WRITE,
+        )
+        kq.control([event], 0)
+
+        watch_new_logs()
+        while True:
+            for ev in kq.control(None, 16):
+                if ev.ident == dir_fd:
+                    watch_new_logs()
+                    continue
+                path = followed_fds.get(ev.ident)
+                if path is None:
+                    continue
+                if ev.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME):
+                    # Closing the fd also removes its kevent
+                    del followed_fds[ev.ident]
+                    follower.forget(path)
+                else:
+                    follower.drain(path)
+    finally:
+        kq.close()
+        os.close(dir_fd)
 
 
 def main() -> None:
     print("\033[1;34m[VLog] Velo Rift Log Consumer\033[0m")
-    log_pattern = "/tmp/vrift-shim-*.log"
-
-    seen_files = set()
-
-    while True:
-        files = glob.glob(log_pattern)
-        for f in files:
-            if f not in seen_files:
-                pid = f.split("-")[-1].split(".")[0]
-                print(f"\n\033[1;32m--- Log for PID {pid} ({f}) ---\033[0m")
-                try:
-                    with open(f, errors="replace") as fd:
-                        print(fd.read())
-                except Exception as e:
-                    print(f"Error reading {f}: {e}")
-                seen_files.add(f)
-
-        if len(sys.argv) > 1 and sys.argv[1] == "--once":
-            break
-
-        time.sleep(1)
+
+    follower = LogFollower()
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--once":
+        follower.follow_new()
+        return
+
+    if sys.platform.startswith("linux"):
+        watch_inotify(follower)
+    elif hasattr(select, "kqueue"):
+        watch_kqueue(follower)
+    else:
+        # No notification API: fall back to polling
+        while True:
+            follower.follow_new()
+            follower.drain_all()
+            time.sleep(1)
 
 
 if __name__ == "__main__":
